@@ -11,6 +11,7 @@ Options:
     --base-pkg  Root package to document   (default: all packages)
     --nav       Print the MkDocs nav YAML block for mkdocs.yml
     --clean     Delete all files in --out before generating
+    --jobs      Worker processes for parsing/rendering (default: CPU count)
     --verbose   Show per-file progress
 """
 
@@ -18,12 +19,16 @@ from __future__ import annotations
 
 import argparse
 import html
+import os
 import re
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Data model
@@ -60,6 +65,18 @@ class ClassDoc:
     deprecated: bool = False
     extends: Optional[str] = None
     implements: list[str] = field(default_factory=list)
+    # Members bucketed by kind, built from `members`; keep in step via add_member
+    members_by_kind: dict[str, list[MemberDoc]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for m in self.members:
+            self.members_by_kind.setdefault(m.kind, []).append(m)
+
+    def add_member(self, member: MemberDoc) -> None:
+        self.members.append(member)
+        self.members_by_kind.setdefault(member.kind, []).append(member)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -70,12 +87,35 @@ class ClassDoc:
 _ARG_TAGS = {"param", "throws", "exception", "see", "uses", "provides"}
 
 _INLINE_TAG_RE = re.compile(r"\{@(\w+)\s+([^}]*)\}")
-_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Any tag; captures the closing slash and the tag name. Only "<" followed by a
+# letter or "/" starts a tag, so a stray "<" (e.g. "a < b" in code samples)
+# never begins a match or swallows the next real tag, and a run of them stays
+# linear.
+_HTML_TAG_RE = re.compile(r"<(/?)([A-Za-z][A-Za-z0-9]*)(?![A-Za-z0-9])[^<>]*(?:<(?![A-Za-z/])[^<>]*)*>")
 _LEADING_STAR_RE = re.compile(r"^\s*\*\s?", re.MULTILINE)
-_ANCHOR_RE = re.compile(r"<a\s+[^>]*href\s*=\s*\"([^\"]+)\"[^>]*>(.*?)</a>", re.DOTALL | re.IGNORECASE)
+# An "@" that could open a block tag line (inline "{@link …}" never does)
+_BLOCK_TAG_HINT_RE = re.compile(r"(?<!\S)@")
+# The opening tag's attributes never cross another "<", so a run of "<a " or
+# unterminated href="… fragments fails each attempt locally
+_ANCHOR_RE = re.compile(r"<a\s[^<>]*?href\s*=\s*\"([^\"<>]+)\"[^<>]*>(.*?)</a>", re.DOTALL | re.IGNORECASE)
 _BROKEN_HREF_RE = re.compile(r"(?<!<a\s)href\s*=\s*\"([^\"]+)\"\s*>", re.IGNORECASE)
 _BARE_URL_RE = re.compile(r"(?<![\[(])\bhttps?://[^\s)<]+")
 
+# --- compiled patterns ---
+_WHITESPACE_RE = re.compile(r"\s+")
+# Tags whose inner text is wrapped in Markdown; nested pairs are handled recursively
+_PAIRED_TAG_MD = {"b": "**", "strong": "**", "i": "*", "em": "*", "code": "`", "tt": "`"}
+_PAIRED_OPEN_RE = re.compile(r"<(h[1-6]|b|strong|i|em|code|tt)\b[^>]*>", re.IGNORECASE)
+_PAIRED_CLOSE_RES = {
+    tag: re.compile(f"</{tag}>", re.IGNORECASE)
+    for tag in [*_PAIRED_TAG_MD, *(f"h{i}" for i in range(1, 7))]
+}
+_PRE_CODE_RE = re.compile(r"<pre>\{@code\s*(.*?)\s*\}</pre>", re.DOTALL)
+_PRE_RE = re.compile(r"<pre>(.*?)</pre>", re.DOTALL)
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n{3,}")
+# An "&" that does not start one of the entities _unescape_html decodes itself
+_OTHER_ENTITY_RE = re.compile(r"&(?!(?:amp|lt|gt|quot|#39);)")
+
 
 def _strip_javadoc_stars(raw: str) -> str:
     """Remove /** … */ delimiters and leading * characters."""
@@ -87,24 +127,82 @@ def _strip_javadoc_stars(raw: str) -> str:
     return _LEADING_STAR_RE.sub("", raw).strip()
 
 
+def _link_to_md(content: str) -> str:
+    # e.g. {@link SomeClass#method()} → `SomeClass.method()`
+    label = content.replace("#", ".").split(" ", 1)
+    return f"`{label[1] if len(label) > 1 else label[0]}`"
+
+
+# Inline tag name → Markdown renderer for its (stripped) content.
+# Unknown tags ({@literal …}, {@inheritDoc …}) render their content as-is.
+_INLINE_TAG_HANDLERS = {
+    "code": lambda c: f"`{c}`",
+    "link": _link_to_md,
+    "linkplain": _link_to_md,
+    "value": lambda c: f"`{c}`",
+}
+
+
+def _inline_tag_repl(m: re.Match) -> str:
+    content = m.group(2).strip()
+    handler = _INLINE_TAG_HANDLERS.get(m.group(1))
+    return handler(content) if handler else content
+
+
+_inline_tag_sub = _INLINE_TAG_RE.sub
+
+
 def _inline_tags_to_md(text: str) -> str:
     """Convert {@code …}, {@link …}, {@linkplain …}, {@literal …} to Markdown."""
-    def replace(m: re.Match) -> str:
-        tag, content = m.group(1), m.group(2).strip()
-        if tag == "code":
-            return f"`{content}`"
-        if tag in ("link", "linkplain"):
-            # e.g. {@link SomeClass#method()} → `SomeClass.method()`
-            label = content.replace("#", ".").split(" ", 1)
-            ref = label[0]
-            display = label[1] if len(label) > 1 else ref
-            return f"`{display}`"
-        if tag == "literal":
-            return content
-        if tag == "value":
-            return f"`{content}`"
-        return content
-    return _INLINE_TAG_RE.sub(replace, text)
+    if "{@" not in text:
+        return text
+    return _inline_tag_sub(_inline_tag_repl, text)
+
+
+def _unescape_html(text: str) -> str:
+    """html.unescape, with fast paths for the few entities Javadoc actually uses."""
+    if "&" not in text:
+        return text
+    if _OTHER_ENTITY_RE.search(text):
+        return html.unescape(text)
+    # "&amp;" goes last so "&amp;lt;" decodes to "&lt;", as html.unescape does
+    return (text.replace("&lt;", "<").replace("&gt;", ">").replace("&quot;", '"')
+            .replace("&#39;", "'").replace("&amp;", "&"))
+
+
+def _paired_tags_to_md(text: str) -> str:
+    """Convert <b>…</b>, <code>…</code>, <h3>…</h3> etc. to Markdown.
+
+    Each opening tag pairs with the first matching closing tag after it.
+    Once a tag is known to have no closing tag left, later openings of it
+    are skipped without rescanning the rest of the text.
+    """
+    out: list[str] = []
+    unclosed: set[str] = set()
+    search = _PAIRED_OPEN_RE.search
+    pos = 0
+    m = search(text)
+    while m:
+        tag = m.group(1).lower()
+        close = None if tag in unclosed else _PAIRED_CLOSE_RES[tag].search(text, m.end())
+        if close is None:
+            unclosed.add(tag)
+            m = search(text, m.start() + 1)
+            continue
+        inner = text[m.end():close.start()]
+        if "<" in inner:
+            inner = _paired_tags_to_md(inner)
+        marker = _PAIRED_TAG_MD.get(tag)
+        out.append(text[pos:m.start()])
+        if marker is None:
+            # <h1> maps to "##" so the page title stays the only top-level heading
+            out.append(f"\n{'#' * (int(tag[1]) + 1)} {inner}\n")
+        else:
+            out.append(f"{marker}{inner}{marker}")
+        pos = close.end()
+        m = search(text, pos)
+    out.append(text[pos:])
+    return "".join(out)
 
 
 def _html_to_md(text: str) -> str:
@@ -117,61 +215,89 @@ def _html_to_md(text: str) -> str:
     text = _BROKEN_HREF_RE.sub(r'<a h' 'ref="\1">', text)
 
     def anchor_repl(m: re.Match) -> str:
-        url = re.sub(r"\s+", "", m.group(1))
-        label = re.sub(r"\s+", " ", m.group(2)).strip()
+        url = _WHITESPACE_RE.sub("", m.group(1))
+        label = _WHITESPACE_RE.sub(" ", m.group(2)).strip()
         if not label:
             label = url
         return f"[{label}]({url})"
 
-    text = _ANCHOR_RE.sub(anchor_repl, text)
-
-    # Headings
-    for i in range(6, 0, -1):
-        text = re.sub(rf"<h{i}[^>]*>(.*?)</h{i}>", rf"\n{'#' * (i + 1)} \1\n", text, flags=re.DOTALL | re.IGNORECASE)
-    # Lists
-    text = re.sub(r"<ul[^>]*>|</ul>|<ol[^>]*>|</ol>", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"<li[^>]*>(.*?)(?=<li|</[uo]l>|$)", lambda m: f"\n- {m.group(1).strip()}", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"</li>", "", text, flags=re.IGNORECASE)
-    # Inline formatting
-    text = re.sub(r"<b>(.*?)</b>", r"**\1**", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<strong>(.*?)</strong>", r"**\1**", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<i>(.*?)</i>", r"*\1*", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<em>(.*?)</em>", r"*\1*", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<code>(.*?)</code>", r"`\1`", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<tt>(.*?)</tt>", r"`\1`", text, flags=re.DOTALL | re.IGNORECASE)
-    # Paragraphs / line breaks
-    text = re.sub(r"<p\s*/?>", "\n\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"</p>", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.IGNORECASE)
-    # Strip remaining tags
-    text = _HTML_TAG_RE.sub("", text)
+    # An anchor can only end at a "</a>", so stop before any unclosed trailing ones
+    anchors_end = max(text.rfind("</a>"), text.rfind("</A>"))
+    if anchors_end != -1:
+        anchors_end += 4
+        text = _ANCHOR_RE.sub(anchor_repl, text[:anchors_end]) + text[anchors_end:]
+
+    # Headings and inline formatting
+    text = _paired_tags_to_md(text)
+
+    # Lists, paragraphs and line breaks in one sweep; every other tag is dropped.
+    # A list item's text runs until the next <li> (or the end) and is trimmed
+    # on both sides; <ul>/<ol> wrappers are transparent to that trimming.
+    out: list[str] = []
+    pending: list[str] = []   # text since the last non-wrapper tag
+    in_item = item_opened = False
+    pos = 0
+    # Nothing past the last ">" can be a tag, so never scan a trailing "a < b"
+    for m in _HTML_TAG_RE.finditer(text, 0, text.rfind(">") + 1):
+        pending.append(text[pos:m.start()])
+        pos = m.end()
+        tag = m.group(2).lower()
+        if tag == "ul" or tag == "ol":
+            continue
+        opening = not m.group(1)
+        chunk = "".join(pending)
+        pending.clear()
+        if item_opened:
+            chunk = chunk.lstrip()
+        item_opened = opening and tag == "li"
+        if item_opened and in_item:
+            chunk = chunk.rstrip()
+        out.append(chunk)
+        if item_opened:
+            out.append("\n- ")
+            in_item = True
+        elif opening and tag == "p":
+            out.append("\n\n")
+        elif opening and tag == "br":
+            out.append("\n")
+    pending.append(text[pos:])
+    chunk = "".join(pending)
+    if in_item:
+        # The last item runs to the end of the text, minus a final newline
+        final_nl = "\n" if chunk.endswith("\n") else ""
+        chunk = chunk.strip() if item_opened else chunk.rstrip()
+        chunk += final_nl
+    out.append(chunk)
+    text = "".join(out)
+
     # Decode HTML entities
-    text = html.unescape(text)
+    text = _unescape_html(text)
     # Preserve bare URLs as clickable Markdown links.
     text = _BARE_URL_RE.sub(lambda m: f"[{m.group(0)}]({m.group(0)})", text)
     return text
 
 
+# Boilerplate tag text ("the name", "{@inheritDoc}", "true if …") repeats
+# across a codebase, so each distinct string is converted once per process.
+@lru_cache(maxsize=8192)
 def _convert_description(raw: str) -> str:
     """Full pipeline: strip stars → pre-blocks → inline tags → HTML → clean up."""
     text = _strip_javadoc_stars(raw) if raw.startswith("/**") else raw
     # Handle <pre>{@code ...}</pre> BEFORE inline-tag conversion so the {@code
     # is not double-processed into backticks.
-    text = re.sub(
-        r"<pre>\{@code\s*(.*?)\s*\}</pre>",
+    text = _PRE_CODE_RE.sub(
         lambda m: "\n```java\n" + m.group(1).strip() + "\n```\n",
-        text, flags=re.DOTALL,
+        text,
     )
     # Plain <pre>...</pre> (no {@code})
-    text = re.sub(
-        r"<pre>(.*?)</pre>",
+    text = _PRE_RE.sub(
         lambda m: "\n```\n" + m.group(1).strip() + "\n```\n",
-        text, flags=re.DOTALL,
+        text,
     )
     text = _inline_tags_to_md(text)
     text = _html_to_md(text)
     # Collapse more than two consecutive blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _EXTRA_BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -181,6 +307,8 @@ def _parse_javadoc_block(raw_comment: str) -> tuple[str, list[Tag]]:
     Returns plain text (not yet HTML-converted) for the description.
     """
     body = _strip_javadoc_stars(raw_comment)
+    if not _BLOCK_TAG_HINT_RE.search(body):
+        return "\n".join(body.splitlines()).strip(), []
 
     description_lines: list[str] = []
     tag_chunks: list[str] = []
@@ -205,15 +333,13 @@ def _parse_javadoc_block(raw_comment: str) -> tuple[str, list[Tag]]:
 
     tags: list[Tag] = []
     for chunk in tag_chunks:
-        lines = chunk.splitlines()
-        first = lines[0].strip()
-        rest = "\n".join(line.strip() for line in lines[1:]).strip()
+        # Continuation lines were stripped as the chunk was built
+        first, _, rest = chunk.partition("\n")
+        rest = rest.strip()
 
         parts = first.split(None, 1)
         tag_name = parts[0].lower()
-        remainder = parts[1] if len(parts) > 1 else ""
-        if rest:
-            remainder = (remainder + " " + rest).strip()
+        remainder = (parts[1] + " " + rest).strip() if len(parts) > 1 else rest
 
         if tag_name in _ARG_TAGS:
             sub = remainder.split(None, 1)
@@ -234,49 +360,53 @@ def _parse_javadoc_block(raw_comment: str) -> tuple[str, list[Tag]]:
 
 # Regex patterns for Java constructs
 _PACKAGE_RE = re.compile(r"^\s*package\s+([\w.]+)\s*;", re.MULTILINE)
-_JAVADOC_RE = re.compile(r"/\*\*.*?\*/", re.DOTALL)
+# Single-pass source tokenizer. Javadoc blocks (group 1) and type-declaration
+# keywords (group 2) are captured; other comments and string/char literals
+# are consumed so nothing inside them is mistaken for a declaration.
+_TOKEN_RE = re.compile(
+    r"(/\*\*.*?\*/)"
+    r"|/\*.*?\*/|//[^\n]*"
+    r'|""".*?"""|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+    r"|(?<![\w$.])(@interface|class|interface|enum|record)\b",
+    re.DOTALL,
+)
+# Rest of a type declaration after its keyword: name, generics, extends,
+# implements, permits … up to the '{' (or '(' for records) opening the body
+_TYPE_HEADER_RE = re.compile(r"\s+\w+[^{(;]*[{(]")
+# Modifiers directly in front of a type-declaration keyword
+_TYPE_MODIFIERS_RE = re.compile(
+    r"(?:\b(?:public|protected|private|static|abstract|final|sealed|non-sealed)\s+)+$"
+)
+# Annotations between a member's Javadoc and its declaration (used with .match)
+_ANNOTATION_STRIP_RE = re.compile(r"\s*(?:@\w+(?:\([^)]*\))?\s*)+")
+# Kind keyword and name at the head of the primary type declaration
+_KIND_NAME_RE = re.compile(r"(?P<kind>@interface|class|interface|enum|record)\s+(?P<name>\w+)")
+_EXTENDS_RE = re.compile(r"\bextends\b\s+([\w.<>, ]+?)(?:\s+(?:implements|permits)\b|\s*[{(])")
+_IMPLEMENTS_RE = re.compile(r"\bimplements\b\s+([\w.<>, ]+?)(?:\s+permits\b|\s*[{(])")
+# Member signatures: nested type declarations, method names, field names
+_INNER_CLASS_RE = re.compile(r"\b(?:class|interface|enum|record|@interface)\b")
+_METHOD_NAME_RE = re.compile(r"(\w+)\s*\(")
+_FIELD_NAME_RE = re.compile(r"(\w+)\s*(?:[=;]|$)")
+# How far past a member's Javadoc we look for the end of its signature
+_SIGNATURE_WINDOW = 600
 
 # Modifiers we care about
 _MODIFIERS = {"public", "protected", "private", "static", "abstract", "final",
               "default", "synchronized", "native", "strictfp", "sealed", "non-sealed"}
-
-_CLASS_DECL_RE = re.compile(
-    r"(?:(?:public|protected|private|static|abstract|final|sealed|non-sealed)\s+)*"
-    r"(?P<kind>class|interface|enum|record|@interface)\s+"
-    r"(?P<name>\w+)"
-    r"(?P<generics><[^{;]*?>)?"
-    r"(?:\s+extends\s+(?P<extends>[\w.<>, ]+?))?"
-    r"(?:\s+implements\s+(?P<implements>[\w.<>, ]+?))?"
-    r"(?:\s+permits\s+[\w.<>, ]+?)?"
-    r"\s*[{(]"
-)
-
-_METHOD_RE = re.compile(
-    r"(?:(?:public|protected|private|static|abstract|final|default|synchronized|native|override)\s+)*"
-    r"(?:@\w+(?:\([^)]*\))?\s+)*"  # annotations before return type
-    r"(?:[\w.<>\[\]@?]+\s+)+"      # return type (may have generics / annotations)
-    r"(\w+)\s*\("                   # method name
-    r"([^)]*)\)"                    # parameters
-    r"(?:\s+throws\s+[\w.,\s<>]+)?" # throws
-    r"\s*[{;]"
-)
-
-_FIELD_RE = re.compile(
-    r"(?:(?:public|protected|private|static|final|volatile|transient)\s+)+"
-    r"(?:[\w.<>\[\]@?]+\s+)+"       # type
-    r"(\w+)"                         # field name
-    r"\s*(?:=|;)"
+# Whole whitespace-delimited modifier words, in declaration order
+_MODIFIER_SCAN_RE = re.compile(
+    r"(?<!\S)(?:" + "|".join(sorted(_MODIFIERS)) + r")(?!\S)"
 )
 
 
 def _extract_modifiers(text_before: str) -> list[str]:
-    return [w for w in text_before.split() if w in _MODIFIERS]
+    return _MODIFIER_SCAN_RE.findall(text_before)
 
 
 def _guess_member_kind(text: str) -> str:
     """Classify a member declaration snippet."""
     stripped = text.strip()
-    if re.search(r"\w+\s*\(", stripped):
+    if _METHOD_NAME_RE.search(stripped):
         return "method"
     return "field"
 
@@ -284,56 +414,78 @@ def _guess_member_kind(text: str) -> str:
 def _parse_member_signature(sig_line: str) -> tuple[str, str]:
     """Return (name, cleaned_signature)."""
     # Try to find a method name
-    m = re.search(r"(\w+)\s*\(", sig_line)
+    m = _METHOD_NAME_RE.search(sig_line)
     if m:
         return m.group(1), sig_line.strip()
     # Field: last identifier before = or ;
-    m = re.search(r"(\w+)\s*(?:[=;]|$)", sig_line)
+    m = _FIELD_NAME_RE.search(sig_line)
     if m:
         return m.group(1), sig_line.strip()
     return "unknown", sig_line.strip()
 
 
-def _find_class_body_pairs(source: str) -> list[tuple[str, int, int]]:
+def _scan_java_source(
+    source: str,
+) -> tuple[list[tuple[int, int, str]], Optional[tuple[str, int, int]]]:
     """
-    Scan source for class/interface/enum/record/@interface declarations.
-    Returns list of (declaration_header, start_of_header, start_of_body).
-    start_of_body points to the '{' or '(' that opens the body.
+    Tokenize source in one forward pass.
+    Returns (javadoc_blocks, primary_decl):
+      - javadoc_blocks: (start, end, text) for every Javadoc comment
+      - primary_decl: (declaration_header, start_of_header, start_of_body) for
+        the first class/interface/enum/record/@interface declaration outside
+        comments and literals, or None.  start_of_body points just past the
+        '{' or '(' that opens the body.
     """
-    results = []
-    for m in _CLASS_DECL_RE.finditer(source):
-        results.append((m.group(0), m.start(), m.end()))
-    return results
+    javadoc_blocks: list[tuple[int, int, str]] = []
+    primary: Optional[tuple[str, int, int]] = None
+    for m in _TOKEN_RE.finditer(source):
+        jd_text = m.group(1)
+        if jd_text is not None:
+            javadoc_blocks.append((m.start(), m.end(), jd_text))
+        elif primary is None and m.group(2) is not None:
+            header_m = _TYPE_HEADER_RE.match(source, m.end())
+            if not header_m:
+                continue    # e.g. "record" used as an identifier
+            start = m.start()
+            mods_m = _TYPE_MODIFIERS_RE.search(source, max(0, start - 200), start)
+            if mods_m:
+                start = mods_m.start()
+            primary = (source[start:header_m.end()], start, header_m.end())
+    return javadoc_blocks, primary
 
 
 def parse_java_file(path: Path) -> Optional[ClassDoc]:
     """Parse a single .java file and return a ClassDoc (or None on failure)."""
     try:
-        source = path.read_text(encoding="utf-8", errors="replace")
+        data = path.read_bytes()
     except OSError:
         return None
+    # Same result as read_text(), minus the TextIOWrapper: decode in one go and
+    # apply universal-newline translation only when the file actually has "\r".
+    source = data.decode("utf-8", "replace")
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+
+    # Without a Javadoc block or a type keyword there is nothing to document;
+    # plain substring checks are far cheaper than starting the tokenizer.
+    if "/**" not in source or not (
+        "class" in source or "interface" in source or "enum" in source or "record" in source
+    ):
+        return None
 
     # Package
     pkg_m = _PACKAGE_RE.search(source)
     package = pkg_m.group(1) if pkg_m else ""
 
-    # Find all Javadoc blocks with their positions
-    javadoc_blocks: list[tuple[int, int, str]] = [
-        (m.start(), m.end(), m.group(0)) for m in _JAVADOC_RE.finditer(source)
-    ]
-
-    # Find the primary class declaration (first top-level)
-    class_decls = _find_class_body_pairs(source)
-    if not class_decls:
+    # Find all Javadoc blocks and the primary class declaration (first top-level)
+    javadoc_blocks, primary_decl = _scan_java_source(source)
+    if primary_decl is None:
         return None
 
-    primary_decl_text, primary_start, primary_body_start = class_decls[0]
+    primary_decl_text, primary_start, primary_body_start = primary_decl
 
     # Determine kind and name from the primary declaration
-    kind_m = re.search(
-        r"(?P<kind>@interface|class|interface|enum|record)\s+(?P<name>\w+)",
-        primary_decl_text
-    )
+    kind_m = _KIND_NAME_RE.search(primary_decl_text)
     if not kind_m:
         return None
 
@@ -349,8 +501,8 @@ def parse_java_file(path: Path) -> Optional[ClassDoc]:
     class_modifiers = _extract_modifiers(before_kind)
 
     # extends / implements
-    extends_m = re.search(r"\bextends\b\s+([\w.<>, ]+?)(?:\s+(?:implements|permits)\b|\s*[{(])", primary_decl_text)
-    implements_m = re.search(r"\bimplements\b\s+([\w.<>, ]+?)(?:\s+permits\b|\s*[{(])", primary_decl_text)
+    extends_m = _EXTENDS_RE.search(primary_decl_text)
+    implements_m = _IMPLEMENTS_RE.search(primary_decl_text)
     extends = extends_m.group(1).strip() if extends_m else None
     implements = [i.strip() for i in implements_m.group(1).split(",")] if implements_m else []
 
@@ -358,11 +510,9 @@ def parse_java_file(path: Path) -> Optional[ClassDoc]:
     class_javadoc = ""
     for jd_start, jd_end, jd_text in reversed(javadoc_blocks):
         if jd_end <= primary_start:
-            # Check nothing but whitespace/annotations between Javadoc end and class start
-            between = source[jd_end:primary_start]
-            if re.fullmatch(r"[\s\S]*", between):  # always true; just use the closest one
-                class_javadoc = jd_text
-                break
+            # Whatever lies in between, the closest preceding block wins
+            class_javadoc = jd_text
+            break
 
     desc_raw, class_tags = _parse_javadoc_block(class_javadoc) if class_javadoc else ("", [])
     description = _convert_description(desc_raw) if desc_raw else ""
@@ -386,30 +536,35 @@ def parse_java_file(path: Path) -> Optional[ClassDoc]:
     # next code declaration.  We operate on the source *after* the class opening.
     body_source = source[primary_body_start:]
 
-    # Re-scan for Javadoc blocks within the body
+    # Javadoc blocks within the body, rebased onto body_source offsets
     member_javadocs: list[tuple[int, int, str]] = [
-        (m.start(), m.end(), m.group(0))
-        for m in _JAVADOC_RE.finditer(body_source)
+        (jd_start - primary_body_start, jd_end - primary_body_start, jd_text)
+        for jd_start, jd_end, jd_text in javadoc_blocks
+        if jd_start >= primary_body_start
     ]
 
     for jd_start, jd_end, jd_text in member_javadocs:
-        # Grab text between end of javadoc and next '{', ';', or end-of-block
-        after = body_source[jd_end:jd_end + 600]
+        # Look only at the text just after the Javadoc, without slicing it out
+        window_end = jd_end + _SIGNATURE_WINDOW
 
-        # Strip annotations between Javadoc and declaration
-        after_stripped = re.sub(r"^\s*(?:@\w+(?:\([^)]*\))?\s*)+", "", after).strip()
+        # Skip annotations between Javadoc and declaration
+        ann_m = _ANNOTATION_STRIP_RE.match(body_source, jd_end, window_end)
+        sig_start = ann_m.end() if ann_m else jd_end
 
         # Find the signature line: up to first '{' or ';'
-        sig_end = min(
-            (after_stripped.find("{") if after_stripped.find("{") != -1 else len(after_stripped)),
-            (after_stripped.find(";") if after_stripped.find(";") != -1 else len(after_stripped)),
-        )
-        sig_line = after_stripped[:sig_end].strip()
+        sig_end = window_end
+        brace = body_source.find("{", sig_start, window_end)
+        if brace != -1:
+            sig_end = brace
+        semi = body_source.find(";", sig_start, sig_end)
+        if semi != -1:
+            sig_end = semi
+        sig_line = body_source[sig_start:sig_end].strip()
         if not sig_line:
             continue
 
         # Skip if this looks like another class declaration
-        if re.search(r"\b(?:class|interface|enum|record|@interface)\b", sig_line):
+        if _INNER_CLASS_RE.search(sig_line):
             continue
 
         member_kind = _guess_member_kind(sig_line)
@@ -436,7 +591,7 @@ def parse_java_file(path: Path) -> Optional[ClassDoc]:
         if "private" in mods and not mdesc and not member_tags:
             continue
 
-        doc.members.append(MemberDoc(
+        mdoc = MemberDoc(
             kind=member_kind,
             name=name,
             signature=signature,
@@ -444,7 +599,8 @@ def parse_java_file(path: Path) -> Optional[ClassDoc]:
             tags=member_tags,
             modifiers=mods,
             deprecated=member_deprecated,
-        ))
+        )
+        doc.add_member(mdoc)
 
     return doc
 
@@ -535,17 +691,17 @@ def _member_section_title(kind: str) -> str:
 
 def render_class_page(doc: ClassDoc) -> str:
     """Render a ClassDoc as a full MkDocs Markdown page."""
-    lines: list[str] = []
+    # Every block after the title is written with its leading "\n" separator.
+    buf = StringIO()
+    w = buf.write
 
     icon = _KIND_ICON.get(doc.kind, "")
     badge = _KIND_BADGE.get(doc.kind, doc.kind.capitalize())
     deprecation_note = " *(deprecated)*" if doc.deprecated else ""
 
-    # Title
-    lines.append(f"# {icon} {doc.name}{deprecation_note}\n")
-
-    # Metadata strip
-    lines.append(f"`{doc.package}.{doc.name}` &nbsp;·&nbsp; **{badge}**\n")
+    # Title + metadata strip
+    w(f"# {icon} {doc.name}{deprecation_note}\n"
+      f"\n`{doc.package}.{doc.name}` &nbsp;·&nbsp; **{badge}**\n")
 
     if doc.extends or doc.implements:
         hierarchy = []
@@ -554,70 +710,64 @@ def render_class_page(doc: ClassDoc) -> str:
         if doc.implements:
             impl_list = ", ".join(f"`{i}`" for i in doc.implements)
             hierarchy.append(f"Implements {impl_list}")
-        lines.append(" &nbsp;·&nbsp; ".join(hierarchy) + "\n")
+        w("\n" + " &nbsp;·&nbsp; ".join(hierarchy) + "\n")
 
-    lines.append("---\n")
+    w("\n---\n")
 
     # Class-level description
     if doc.description:
-        lines.append(doc.description)
-        lines.append("")
+        w(f"\n{doc.description}\n")
 
     # Class-level tags (@author, @since, @deprecated, @see …)
     class_tag_md = _render_tags(doc.tags, skip={"param"})
     if class_tag_md.strip():
-        lines.append(class_tag_md)
+        w(f"\n{class_tag_md}")
 
     if not doc.members:
-        return "\n".join(lines)
-
-    # Group members by kind
-    from collections import defaultdict
-    by_kind: dict[str, list[MemberDoc]] = defaultdict(list)
-    for m in doc.members:
-        by_kind[m.kind].append(m)
+        return buf.getvalue()
 
     # Render each group
     order = ["constant", "element", "field", "method"]
     for kind in order:
-        members = by_kind.get(kind)
+        members = doc.members_by_kind.get(kind)
         if not members:
             continue
 
         section_title = _member_section_title(kind)
-        lines.append(f"## {section_title}\n")
+        w(f"\n## {section_title}\n")
 
+        last = members[-1]
         for m in members:
             dep_note = " *(deprecated)*" if m.deprecated else ""
-            lines.append(f"### `{m.name}`{dep_note}\n")
-
-            # Signature block
+            # Heading + signature block
             clean_sig = m.signature.strip()
-            lines.append(f"```java\n{clean_sig}\n```\n")
+            w(f"\n### `{m.name}`{dep_note}\n\n```java\n{clean_sig}\n```\n")
+
+            tag_md = _render_tags(m.tags)
+            has_tags = bool(tag_md.strip())
 
+            # The last member of a group gets no trailing blank line or hr
             if m.description:
-                lines.append(m.description)
-                lines.append("")
+                w(f"\n{m.description}")
+                if m is not last or has_tags:
+                    w("\n")
 
-            tag_md = _render_tags(m.tags)
-            if tag_md.strip():
-                lines.append(tag_md)
+            if has_tags:
+                w(f"\n{tag_md}")
 
-            lines.append("---\n")
+            if m is not last:
+                w("\n---\n")
 
-        # Remove trailing hr for cleanliness
-        while lines and lines[-1].strip() in ("---", "---\n", ""):
-            lines.pop()
-        lines.append("")
+        w("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def render_package_index(package: str, classes: list[ClassDoc]) -> str:
     """Render the index page for a package."""
-    lines: list[str] = []
-    lines.append(f"# Package `{package}`\n")
-    lines.append("---\n")
+    buf = StringIO()
+    w = buf.write
+    w(f"# Package `{package}`\n\n---\n")
 
     by_kind: dict[str, list[ClassDoc]] = {}
     for doc in sorted(classes, key=lambda d: d.name):
@@ -630,9 +780,9 @@ def render_package_index(package: str, classes: list[ClassDoc]) -> str:
             continue
         badge = _KIND_BADGE.get(kind, kind.capitalize())
         icon = _KIND_ICON.get(kind, "")
-        lines.append(f"## {icon} {badge}s\n")
-        lines.append("| Name | Description |")
-        lines.append("|------|-------------|")
+        w(f"\n## {icon} {badge}s\n"
+          "\n| Name | Description |"
+          "\n|------|-------------|")
         for doc in docs:
             slug = doc.name.lower()
             # First sentence of description
@@ -640,42 +790,55 @@ def render_package_index(package: str, classes: list[ClassDoc]) -> str:
             if len(first_sentence) > 100:
                 first_sentence = first_sentence[:97] + "…"
             dep_marker = " *(deprecated)*" if doc.deprecated else ""
-            lines.append(f"| [`{doc.name}`]({slug}.md){dep_marker} | {first_sentence} |")
-        lines.append("")
+            w(f"\n| [`{doc.name}`]({slug}.md){dep_marker} | {first_sentence} |")
+        w("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def render_api_index(all_docs: list[ClassDoc]) -> str:
     """Render the top-level API reference index."""
-    lines: list[str] = []
-    lines.append("# API Reference\n")
-    lines.append(
-        "Auto-generated from Javadoc source comments. "
+    buf = StringIO()
+    w = buf.write
+    w(
+        "# API Reference\n"
+        "\nAuto-generated from Javadoc source comments. "
         "Run `make docs-gen` to regenerate.\n"
+        "\n---\n"
     )
-    lines.append("---\n")
 
     packages: dict[str, list[ClassDoc]] = {}
     for doc in all_docs:
         packages.setdefault(doc.package, []).append(doc)
 
-    lines.append("## Packages\n")
-    lines.append("| Package | Classes |")
-    lines.append("|---------|---------|")
+    w(
+        "\n## Packages\n"
+        "\n| Package | Classes |"
+        "\n|---------|---------|"
+    )
     for pkg in sorted(packages):
         pkg_slug = pkg.replace(".", "/")
         count = len(packages[pkg])
-        lines.append(f"| [`{pkg}`]({pkg_slug}/index.md) | {count} |")
-    lines.append("")
+        w(f"\n| [`{pkg}`]({pkg_slug}/index.md) | {count} |")
+    w("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # File system walker
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _iter_java_files(root: str) -> Iterator[str]:
+    """Yield .java file paths under root; like rglob, symlinked dirs are not entered."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_java_files(entry.path)
+            elif entry.name.endswith(".java") and entry.is_file():
+                yield entry.path
+
+
 def collect_java_files(src_root: Path, base_pkg: str = "") -> list[Path]:
     """Find all .java files under src_root, optionally filtered by base_pkg."""
     if base_pkg:
@@ -683,8 +846,8 @@ def collect_java_files(src_root: Path, base_pkg: str = "") -> list[Path]:
         if not pkg_path.exists():
             print(f"[warn] base-pkg path does not exist: {pkg_path}", file=sys.stderr)
             return []
-        return sorted(pkg_path.rglob("*.java"))
-    return sorted(src_root.rglob("*.java"))
+        return sorted(map(Path, _iter_java_files(str(pkg_path))))
+    return sorted(map(Path, _iter_java_files(str(src_root))))
 
 
 def _write_dir_pages(directory: Path) -> None:
@@ -695,16 +858,28 @@ def _write_dir_pages(directory: Path) -> None:
     Then sub-directories and .md files in sorted order.
     This mirrors the actual filesystem structure, so awesome-pages never
     references a path that doesn't exist.
+    Every directory below `directory` is listed with a single scandir, whose
+    cached entry types avoid per-child stat calls.
     """
-    for dirpath in sorted(directory.rglob("*")):
-        if not dirpath.is_dir():
+    # (path, write_pages) — the top-level directory itself gets no .pages file
+    pending: list[tuple[str, bool]] = [(str(directory), False)]
+    while pending:
+        dirpath, write_pages = pending.pop()
+        children_dirs: list[str] = []
+        children_md: list[str] = []
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, True))
+                    if not entry.name.startswith("."):
+                        children_dirs.append(entry.name)
+                elif entry.name.endswith(".md") and entry.name != ".md":
+                    children_md.append(entry.name)
+        if not write_pages:
             continue
-        children_dirs = sorted(
-            [c.name for c in dirpath.iterdir() if c.is_dir() and not c.name.startswith(".")]
-        )
-        children_md = sorted(
-            [c.name for c in dirpath.iterdir() if c.suffix == ".md"]
-        )
+
+        children_dirs.sort()
+        children_md.sort()
         # index.md always comes first
         ordered_md: list[str] = []
         if "index.md" in children_md:
@@ -719,7 +894,43 @@ def _write_dir_pages(directory: Path) -> None:
 
         if nav_entries:
             pages_content = "nav:\n" + "\n".join(nav_entries) + "\n"
-            (dirpath / ".pages").write_text(pages_content, encoding="utf-8")
+            Path(dirpath, ".pages").write_text(pages_content, encoding="utf-8")
+
+
+def _write_files(directory: Path, files: list[tuple[str, str]]) -> None:
+    """
+    Write (file name, content) pairs into one directory, creating it if needed.
+    Where the OS supports dir_fd, the directory is opened once and every file
+    is opened relative to it, so the full path is not re-resolved per file.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    if os.open not in os.supports_dir_fd:
+        for name, content in files:
+            (directory / name).write_text(content, encoding="utf-8")
+        return
+
+    dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        def opener(name: str, flags: int) -> int:
+            return os.open(name, flags, 0o666, dir_fd=dir_fd)
+
+        for name, content in files:
+            with open(name, "wb", opener=opener) as f:
+                f.write(content.encode("utf-8"))
+    finally:
+        os.close(dir_fd)
+
+
+def _parse_and_render(path: Path) -> tuple[Optional[ClassDoc], str]:
+    """
+    Parse one file and render its class page (worker entry point).
+    The page is empty when the file has nothing worth documenting.
+    """
+    doc = parse_java_file(path)
+    # Only include files with at least a class-level Javadoc OR members with docs
+    if doc is None or not (doc.description or doc.tags or doc.members):
+        return None, ""
+    return doc, render_class_page(doc)
 
 
 def generate_docs(
@@ -728,9 +939,12 @@ def generate_docs(
     base_pkg: str = "",
     verbose: bool = False,
     clean: bool = False,
+    jobs: Optional[int] = None,
 ) -> list[ClassDoc]:
     """
     Parse all Java files and write Markdown pages under out_dir.
+    Parsing and page rendering run in `jobs` worker processes
+    (default: one per CPU); jobs=1 keeps everything in-process.
     Returns the list of all parsed ClassDocs.
     """
     if clean and out_dir.exists():
@@ -746,21 +960,28 @@ def generate_docs(
         return []
 
     all_docs: list[ClassDoc] = []
+    class_pages: list[str] = []
     skipped = 0
 
-    for jf in java_files:
-        if verbose:
-            print(f"  parsing {jf.relative_to(src_root)}")
-        doc = parse_java_file(jf)
-        if doc is None:
-            skipped += 1
-            continue
-        # Only include files with at least a class-level Javadoc OR members with docs
-        has_content = bool(doc.description or doc.tags or doc.members)
-        if not has_content:
-            skipped += 1
-            continue
-        all_docs.append(doc)
+    jobs = jobs or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and len(java_files) > 1 else None
+    try:
+        if executor:
+            results = executor.map(_parse_and_render, java_files, chunksize=16)
+        else:
+            results = map(_parse_and_render, java_files)
+        # Results come back in file order, so progress output stays sorted
+        for jf, (doc, page) in zip(java_files, results):
+            if verbose:
+                print(f"  parsing {jf.relative_to(src_root)}")
+            if doc is None:
+                skipped += 1
+                continue
+            all_docs.append(doc)
+            class_pages.append(page)
+    finally:
+        if executor:
+            executor.shutdown()
 
     print(f"[info] Parsed {len(all_docs)} classes ({skipped} skipped — no Javadoc)")
 
@@ -769,24 +990,24 @@ def generate_docs(
     for doc in all_docs:
         packages.setdefault(doc.package, []).append(doc)
 
-    # Write per-class pages
-    for doc in all_docs:
+    # Queue every page under its directory; later entries win on a name clash
+    writes: dict[Path, list[tuple[str, str]]] = {}
+
+    # Per-class pages
+    for doc, page in zip(all_docs, class_pages):
         pkg_dir = out_dir / doc.package.replace(".", "/")
-        pkg_dir.mkdir(parents=True, exist_ok=True)
-        page = render_class_page(doc)
-        out_path = pkg_dir / f"{doc.name.lower()}.md"
-        out_path.write_text(page, encoding="utf-8")
+        writes.setdefault(pkg_dir, []).append((f"{doc.name.lower()}.md", page))
 
-    # Write package index pages + awesome-pages .pages files
+    # Package index pages
     for pkg, docs in packages.items():
         pkg_dir = out_dir / pkg.replace(".", "/")
-        pkg_dir.mkdir(parents=True, exist_ok=True)
-        index_page = render_package_index(pkg, docs)
-        (pkg_dir / "index.md").write_text(index_page, encoding="utf-8")
+        writes.setdefault(pkg_dir, []).append(("index.md", render_package_index(pkg, docs)))
+
+    # Top-level API index
+    writes.setdefault(out_dir, []).append(("index.md", render_api_index(all_docs)))
 
-    # Write top-level API index
-    api_index = render_api_index(all_docs)
-    (out_dir / "index.md").write_text(api_index, encoding="utf-8")
+    for directory, files in writes.items():
+        _write_files(directory, files)
 
     # Write .pages files for every directory under out_dir.
     # Each .pages file only references *direct* children of that directory,
@@ -809,21 +1030,18 @@ def generate_nav_yaml(all_docs: list[ClassDoc], out_dir_name: str = "api") -> st
     for doc in all_docs:
         packages.setdefault(doc.package, []).append(doc)
 
-    lines: list[str] = []
-    lines.append("  - API Reference:")
-    lines.append(f"    - Overview: {out_dir_name}/index.md")
+    buf = StringIO()
+    w = buf.write
+    w(f"  - API Reference:\n    - Overview: {out_dir_name}/index.md")
 
     for pkg in sorted(packages):
         pkg_slug = pkg.replace(".", "/")
         short = pkg.split(".")[-1]
-        lines.append(f"    - {short}:")
-        lines.append(f"      - Overview: {out_dir_name}/{pkg_slug}/index.md")
+        w(f"\n    - {short}:\n      - Overview: {out_dir_name}/{pkg_slug}/index.md")
         for doc in sorted(packages[pkg], key=lambda d: d.name):
-            lines.append(
-                f"      - {doc.name}: {out_dir_name}/{pkg_slug}/{doc.name.lower()}.md"
-            )
+            w(f"\n      - {doc.name}: {out_dir_name}/{pkg_slug}/{doc.name.lower()}.md")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -846,6 +1064,8 @@ def _build_arg_parser() -> argparse.ArgumentParser:
                    help="Print the MkDocs nav YAML block and exit")
     p.add_argument("--clean", action="store_true",
                    help="Delete --out before generating")
+    p.add_argument("--jobs", "-j", type=int, default=None,
+                   help="Worker processes for parsing/rendering (default: CPU count)")
     p.add_argument("--verbose", "-v", action="store_true",
                    help="Show per-file progress")
     return p
@@ -881,6 +1101,7 @@ def main() -> None:
         base_pkg=args.base_pkg,
         verbose=args.verbose,
         clean=args.clean,
+        jobs=args.jobs,
     )
 
     if args.nav and all_docs:
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Regression tests for javadoc2mkdocs.py.
+
+Usage:
+    python3 -m unittest discover -s tools -p "test_*.py"
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import javadoc2mkdocs as j2m
+
+# Generous bound: linear conversion of the inputs below takes milliseconds,
+# the quadratic regressions they guard against take several seconds.
+_TIME_LIMIT = 1.0
+
+
+class MalformedHtmlTest(unittest.TestCase):
+    """Malformed Javadoc HTML must convert in linear time."""
+
+    def _convert(self, fn, text: str) -> str:
+        getattr(fn, "cache_clear", lambda: None)()
+        start = time.perf_counter()
+        result = fn(text)
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, _TIME_LIMIT, f"{fn.__name__} took {elapsed:.2f}s")
+        return result
+
+    def test_stray_less_than_signs(self):
+        md = self._convert(j2m._html_to_md, "Compares: a < b " * 8000 + "<p>done")
+        self.assertTrue(md.startswith("Compares: a < b Compares"))
+        self.assertTrue(md.endswith("\n\ndone"))
+
+    def test_unterminated_tag_name(self):
+        md = self._convert(j2m._convert_description, "<" + "a" * 40000 + "<b>")
+        self.assertEqual(md, "<" + "a" * 40000)
+
+    def test_run_of_stray_less_than_in_tag(self):
+        self._convert(j2m._convert_description, "<a " + "< " * 20000 + "<b>")
+
+    def test_unclosed_anchors(self):
+        md = self._convert(j2m._html_to_md, '<a href="x">y ' * 6000)
+        self.assertNotIn("[", md)
+
+    def test_unclosed_anchor_before_closed_one(self):
+        md = j2m._html_to_md('<a href="u">a</a> and <a href="v">b')
+        self.assertEqual(md, "[a](u) and b")
+
+    def test_anchor_attribute_runs(self):
+        self._convert(j2m._html_to_md, "<a " * 6000 + ">")
+        self._convert(j2m._html_to_md, '<a href="' * 6000 + ">")
+
+    def test_comparisons_in_code_samples_survive(self):
+        self.assertEqual(j2m._html_to_md("if (a < b && c > d)"), "if (a < b && c > d)")
+        self.assertEqual(j2m._html_to_md("<p>List<?> x"), "\n\nList<?> x")
+
+
+class ClassDocMembersTest(unittest.TestCase):
+    """members_by_kind always reflects members, however they were supplied."""
+
+    def test_members_passed_to_constructor_are_rendered(self):
+        doc = j2m.ClassDoc("p", "C", "class", "", members=[
+            j2m.MemberDoc("method", "f", "void f()", "does f"),
+        ])
+        page = j2m.render_class_page(doc)
+        self.assertIn("## Methods", page)
+        self.assertIn("does f", page)
+
+    def test_add_member_updates_both_views(self):
+        doc = j2m.ClassDoc("p", "C", "enum", "")
+        member = j2m.MemberDoc("constant", "A", "A", "first")
+        doc.add_member(member)
+        self.assertEqual(doc.members, [member])
+        self.assertEqual(doc.members_by_kind, {"constant": [member]})
+
+
+class PrimaryTypeTest(unittest.TestCase):
+    """Each file is documented as its own top-level type."""
+
+    def _parse(self, source: str) -> j2m.ClassDoc:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "Sample.java"
+            path.write_text(source, encoding="utf-8")
+            doc = j2m.parse_java_file(path)
+        self.assertIsNotNone(doc)
+        return doc
+
+    def test_keywords_in_javadoc_code_and_prose_are_ignored(self):
+        doc = self._parse(
+            "package p;\n"
+            "\n"
+            "/**\n"
+            " * This class extends nothing; the {@code class} keyword is just text.\n"
+            " *\n"
+            " * <pre>{@code\n"
+            " * public class AgentService {\n"
+            " *   record Article(String title) {}\n"
+            " * }\n"
+            " * }</pre>\n"
+            " */\n"
+            "// class Commented {\n"
+            "public interface Interactable {\n"
+            "  /** Runs it. */\n"
+            "  void run();\n"
+            "}\n"
+        )
+        self.assertEqual((doc.name, doc.kind), ("Interactable", "interface"))
+        self.assertEqual([m.name for m in doc.members], ["run"])
+
+    def test_multi_line_header_wins_over_nested_types(self):
+        doc = self._parse(
+            "package p;\n"
+            "\n"
+            "/** A message sent to a user. */\n"
+            "public sealed interface OutboundMessage\n"
+            "    permits OutboundMessage.Text,\n"
+            "        OutboundMessage.Image {\n"
+            "  /** Message kinds. */\n"
+            "  enum OutboundMessageType { TEXT, IMAGE }\n"
+            "  /** A text message. */\n"
+            "  record Text(String body) implements OutboundMessage {}\n"
+            "}\n"
+        )
+        self.assertEqual((doc.name, doc.kind), ("OutboundMessage", "interface"))
+        self.assertEqual(doc.modifiers, ["public", "sealed"])
+
+    def test_wildcard_generic_header(self):
+        doc = self._parse(
+            "package p;\n"
+            "\n"
+            "/** Writes enums in lower case. */\n"
+            "public class LowercaseEnumSerializer extends ValueSerializer<Enum<?>> {\n"
+            "}\n"
+        )
+        self.assertEqual((doc.name, doc.kind), ("LowercaseEnumSerializer", "class"))
+        self.assertEqual(doc.description, "Writes enums in lower case.")
+
+
+if __name__ == "__main__":
+    unittest.main()